@@ -4,14 +4,15 @@ from __future__ import annotations
 
 import logging
 
+import aiohttp
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE, Platform
+from homeassistant.core import Event, HomeAssistant
 from homeassistant.helpers import config_entry_oauth2_flow
 from homeassistant.helpers import config_validation as cv
 
 from .config_flow import NuheatConductorLocalOAuth2Implementation
-from .const import DOMAIN
+from .const import API_URL, DOMAIN
 
 PLATFORMS = [Platform.CLIMATE]
 
@@ -22,6 +23,18 @@ _LOGGER = logging.getLogger(__name__)
 type NuheatConductorConfigEntry = ConfigEntry
 
 
+async def _async_prewarm(websession: aiohttp.ClientSession) -> None:
+    """Open a keep-alive connection to the API ahead of the first poll."""
+    try:
+        async with websession.head(
+            API_URL + "/api/v1/Account", timeout=aiohttp.ClientTimeout(total=3)
+        ):
+            pass
+    except (aiohttp.ClientError, TimeoutError):
+        # Best effort only; the first real request will connect normally
+        _LOGGER.debug("Connection pre-warm to %s failed", API_URL)
+
+
 async def async_setup_entry(
     hass: HomeAssistant, entry: NuheatConductorConfigEntry
 ) -> bool:
@@ -42,15 +55,38 @@ async def async_setup_entry(
 
     session = config_entry_oauth2_flow.OAuth2Session(hass, entry, implementation)
 
-    # Verify we can get a valid token
-    try:
-        await session.async_ensure_token_valid()
-    except Exception as err:
-        _LOGGER.error("Failed to get valid token: %s", err)
-        return False
+    # Dedicated session so keep-alive connections and cached DNS lookups
+    # to the Nuheat API are reused across polls
+    websession = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit=16,
+            limit_per_host=4,
+            keepalive_timeout=75,
+            ttl_dns_cache=300,
+        ),
+    )
+    # Runs on unload and also if setup fails after this point
+    entry.async_on_unload(websession.close)
+
+    # Config entries are not unloaded on shutdown, so also close on stop
+    async def _async_close_websession(event: Event) -> None:
+        await websession.close()
+
+    entry.async_on_unload(
+        hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_CLOSE, _async_close_websession
+        )
+    )
+    # DNS/TCP/TLS handshake overlaps the token check in platform setup
+    entry.async_create_background_task(
+        hass, _async_prewarm(websession), "nuheat_conductor_prewarm"
+    )
 
     hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = session
+    hass.data[DOMAIN][entry.entry_id] = {
+        "oauth_session": session,
+        "websession": websession,
+    }
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     return True
@@ -4,10 +4,15 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import operator
+import random
+import time
 from collections.abc import Mapping
 from datetime import timedelta
-from typing import Any
+from typing import Any, Final
 
+import aiohttp
+import orjson
 from homeassistant.components.climate import (
     ClimateEntity,
     ClimateEntityFeature,
@@ -16,95 +21,341 @@ from homeassistant.components.climate import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfTemperature
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import PlatformNotReady
 from homeassistant.helpers import config_entry_oauth2_flow
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.update_coordinator import (
+    CoordinatorEntity,
+    DataUpdateCoordinator,
+    UpdateFailed,
+)
 
 from .const import API_URL, DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
 SCAN_INTERVAL = timedelta(minutes=5)
+# Window for coalescing bursts of setpoint/preset changes into one PUT
+WRITE_COOLDOWN = 0.25
+# Per-request timeouts; these replace the session default entirely, so
+# each sets its own connect bound. GETs are small and should fail fast.
+_GET_TIMEOUT = aiohttp.ClientTimeout(total=4, connect=3)
+_WRITE_TIMEOUT = aiohttp.ClientTimeout(total=6, connect=3)
+# Gateway errors worth a single quick retry
+_RETRY_STATUSES = frozenset({502, 503, 504})
+_JSON_HEADERS: Final = {"Content-Type": "application/json"}
+# Polling jitter and error backoff ceiling, in seconds
+SCAN_JITTER = 30
+MAX_BACKOFF = 3600
+
+# Thermostat preset names and their API schedule modes
+_PRESET_TO_MODE: Final[dict[str, int]] = {
+    "Auto": 1,  # Schedule
+    "Hold": 2,  # Temporary hold
+    "Permanent Hold": 3,  # Permanent hold
+}
+# Reverse of _PRESET_TO_MODE, indexed by schedule mode (0 is unused)
+_MODE_TO_PRESET: Final[tuple[str | None, ...]] = (
+    None,
+    "Auto",
+    "Hold",
+    "Permanent Hold",
+)
+
+# Thermostat payload fields that affect entity state
+_THERMOSTAT_STATE_FIELDS: Final = (
+    "currentTemperature",
+    "setPointTemp",
+    "minTemp",
+    "maxTemp",
+    "scheduleMode",
+    "online",
+    "isHeating",
+)
+_get_state_fields = operator.itemgetter(*_THERMOSTAT_STATE_FIELDS)
+
+
+def _read_state_fields(data: dict) -> tuple:
+    """Return the state fields of a thermostat payload in field order."""
+    try:
+        # Fast path: the listing normally carries every field
+        return _get_state_fields(data)
+    except KeyError:
+        get = data.get
+        return (
+            get("currentTemperature"),
+            get("setPointTemp"),
+            get("minTemp"),
+            get("maxTemp"),
+            get("scheduleMode"),
+            get("online", True),
+            get("isHeating", False),
+        )
+
+
+# Controls exposed while a thermostat is online; none while offline
+_ONLINE_FEATURES: Final = (
+    ClimateEntityFeature.TARGET_TEMPERATURE | ClimateEntityFeature.PRESET_MODE
+)
+_OFFLINE_FEATURES: Final = ClimateEntityFeature(0)
+
+# Fallback (min, max) setpoint limits when the API omits minTemp/maxTemp
+_DEFAULT_TEMP_LIMITS: Final[dict[str, tuple[float, float]]] = {
+    UnitOfTemperature.CELSIUS: (5.0, 40.0),
+    UnitOfTemperature.FAHRENHEIT: (41.0, 104.0),
+}
+
+
+def _to_degrees(value: int | None) -> float | None:
+    """Convert an API temperature integer (3000 = 30.00) to degrees."""
+    return value / 100 if value is not None else None
+
+
+def _parse_retry_after(value: str | None) -> float:
+    """Return a Retry-After delay in seconds, defaulting to one poll interval."""
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        # Missing or HTTP-date form; wait one regular poll
+        return SCAN_INTERVAL.total_seconds()
 
 
 class NuheatConductorAPI:
     """API client for Nuheat Conductor thermostats using OAuth2 session."""
 
+    __slots__ = (
+        "_oauth_session",
+        "_websession",
+        "_cached_token",
+        "_token_exp",
+        "_refresh_lock",
+        "_headers",
+        "_base_url",
+        "_last_payload",
+        "_schedule_bodies",
+        "_retry_at",
+    )
+
     def __init__(
         self,
         session: config_entry_oauth2_flow.OAuth2Session,
-        websession,
+        websession: aiohttp.ClientSession,
     ) -> None:
         """Initialize the API client."""
         self._oauth_session = session
         self._websession = websession
+        self._cached_token: str | None = None
+        self._token_exp: float = 0.0
+        self._refresh_lock = asyncio.Lock()
+        # Static headers reused across requests; Authorization is only
+        # rewritten when the cached token rotates
+        self._headers: dict[str, str] = {
+            "Accept": "application/json",
+            "Authorization": "",
+        }
+        self._base_url = API_URL
+        # Last setpoint body sent per thermostat, mutated in place per call
+        self._last_payload: dict[str, dict[str, Any]] = {}
+        # Encoded schedule-mode bodies: (serial, mode) -> JSON bytes
+        self._schedule_bodies: dict[tuple[str, int], bytes] = {}
+        # Monotonic time before which a 429 asked us not to call the API
+        self._retry_at: float = 0.0
 
-    async def _get_access_token(self) -> str:
-        """Get a valid access token."""
-        await self._oauth_session.async_ensure_token_valid()
-        return self._oauth_session.token["access_token"]
+    @property
+    def retry_after(self) -> float:
+        """Seconds left on the current rate-limit pause, 0 if none."""
+        return max(0.0, self._retry_at - time.monotonic())
+
+    def _token_is_fresh(self) -> bool:
+        """Return True if the cached token is more than 60s from expiry."""
+        return (
+            self._cached_token is not None
+            and time.monotonic() < self._token_exp - 60
+        )
+
+    async def _get_access_token(self, rejected: str | None = None) -> str:
+        """Get a valid access token, reusing the cached one until near expiry.
+
+        Passing the token the API just rejected forces a real refresh, since
+        async_ensure_token_valid is a no-op while the token looks unexpired.
+        """
+        if rejected is None and self._token_is_fresh():
+            return self._cached_token
+
+        # Single-flight refresh: concurrent callers wait on the lock and
+        # reuse the token obtained by whichever caller got there first
+        async with self._refresh_lock:
+            if self._token_is_fresh() and self._cached_token != rejected:
+                return self._cached_token
+
+            session = self._oauth_session
+            if rejected is not None and session.token["access_token"] == rejected:
+                # Same steps async_ensure_token_valid takes once expired
+                new_token = await session.implementation.async_refresh_token(
+                    session.token
+                )
+                session.hass.config_entries.async_update_entry(
+                    session.config_entry,
+                    data={**session.config_entry.data, "token": new_token},
+                )
+            else:
+                await session.async_ensure_token_valid()
+            token = session.token
+            if token["access_token"] != self._cached_token:
+                self._headers["Authorization"] = f"Bearer {token['access_token']}"
+            self._cached_token = token["access_token"]
+            # HA stores expires_at as wall-clock time; convert to monotonic base
+            self._token_exp = time.monotonic() + (
+                token.get("expires_at", 0) - time.time()
+            )
+            return self._cached_token
 
     async def _make_request(
-        self, method: str, endpoint: str, **kwargs: Any
+        self,
+        method: str,
+        endpoint: str,
+        decode: bool = True,
+        expect: type | None = None,
+        **kwargs: Any,
     ) -> dict | list | None:
-        """Make an authenticated API request."""
-        try:
-            access_token = await self._get_access_token()
-        except Exception:
-            _LOGGER.exception("Failed to get access token")
-            return None
+        """Make an authenticated API request.
 
-        headers = kwargs.pop("headers", {})
-        headers["Authorization"] = f"Bearer {access_token}"
-        headers["Accept"] = "application/json"
+        Callers that only need success/failure pass decode=False so a 200
+        body is not parsed. With expect=list or expect=dict, a decoded body
+        of the wrong shape is returned as [] or None respectively.
+        """
+        extra_headers = kwargs.pop("headers", None)
+        if (body := kwargs.pop("json", None)) is not None:
+            # Serialize with orjson instead of aiohttp's stdlib json encoder
+            kwargs["data"] = orjson.dumps(body)
+            extra_headers = {**(extra_headers or {}), **_JSON_HEADERS}
+
+        if self._retry_at and time.monotonic() < self._retry_at:
+            # Still inside a Retry-After window; don't spend quota on it
+            _LOGGER.debug("Skipping request to %s while rate limited", endpoint)
+            return None
 
-        url = f"{API_URL}{endpoint}"
+        url = self._base_url + endpoint
+        timeout = _GET_TIMEOUT if method == "GET" else _WRITE_TIMEOUT
+
+        # One retry is allowed for a 401 (after forcing a real token refresh)
+        # and for transient gateway/connection failures. Other 4xx responses
+        # are not retried.
+        rejected: str | None = None
+        for attempt in range(2):
+            can_retry = attempt == 0
+            try:
+                sent_token = await self._get_access_token(rejected)
+            except Exception as err:
+                # Full traceback only when debugging; refresh failures are
+                # usually transient network errors
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.exception("Failed to get access token")
+                else:
+                    _LOGGER.warning("Failed to get access token: %s", err)
+                return None
 
-        try:
-            async with (
-                asyncio.timeout(10),
-                self._websession.request(
-                    method, url, headers=headers, **kwargs
-                ) as resp,
-            ):
-                if resp.status == 401:
+            headers = self._headers
+            if extra_headers:
+                headers = {**headers, **extra_headers}
+
+            try:
+                async with self._websession.request(
+                    method, url, headers=headers, timeout=timeout, **kwargs
+                ) as resp:
+                    # Drain the body exactly once so the connection can go
+                    # back to the keep-alive pool, then branch on status
+                    raw = await resp.read()
+                    status = resp.status
+                if status == 401:
+                    rejected = sent_token
+                    self._cached_token = None
+                    self._token_exp = 0.0
+                    if can_retry:
+                        # Token revoked or rotated server-side; retried below
+                        _LOGGER.debug("Received 401, refreshing token")
+                        continue
                     _LOGGER.warning("Received 401, token may be invalid")
                     return None
-                if resp.status == 200:
-                    return await resp.json()
-                if resp.status == 204:
+                if status == 429:
+                    delay = _parse_retry_after(resp.headers.get("Retry-After"))
+                    self._retry_at = time.monotonic() + delay
+                    _LOGGER.warning(
+                        "Rate limited by the Nuheat API on %s, pausing for %ds",
+                        endpoint,
+                        delay,
+                    )
+                    return None
+                if status == 200:
+                    if not decode or not raw:
+                        return {}
+                    try:
+                        data = orjson.loads(raw)
+                    except orjson.JSONDecodeError:
+                        # e.g. a maintenance or proxy HTML page served as 200
+                        _LOGGER.error(
+                            "Request to %s returned invalid JSON - Response: %s",
+                            endpoint,
+                            raw[:512].decode("utf-8", "replace"),
+                        )
+                        return None
+                    # orjson only produces exact list/dict instances
+                    if expect is not None and type(data) is not expect:
+                        return [] if expect is list else None
+                    return data
+                if status == 204:
                     # 204 No Content - success with no body (common for PUT/POST)
                     return {}
-                # Log detailed error information for non-success responses
-                error_body = await resp.text()
-                _LOGGER.error(
-                    "Request to %s failed: %s - Response: %s",
-                    endpoint,
-                    resp.status,
-                    error_body,
-                )
+                if not (can_retry and status in _RETRY_STATUSES):
+                    # Log detailed error information for non-success responses,
+                    # truncated so large error pages don't bloat the log
+                    _LOGGER.error(
+                        "Request to %s failed: %s - Response: %s",
+                        endpoint,
+                        status,
+                        raw[:512].decode("utf-8", "replace"),
+                    )
+                    return None
+                _LOGGER.debug("Request to %s got %s, retrying", endpoint, status)
+            except TimeoutError:
+                if not can_retry:
+                    _LOGGER.error("Timeout during request to %s", endpoint)
+                    return None
+                _LOGGER.debug("Timeout during request to %s, retrying", endpoint)
+            except (
+                aiohttp.ClientConnectorError,
+                aiohttp.ServerDisconnectedError,
+            ) as err:
+                if not can_retry:
+                    _LOGGER.warning(
+                        "HTTP error during request to %s: %s", endpoint, err
+                    )
+                    return None
+                _LOGGER.debug("Error during request to %s, retrying: %s", endpoint, err)
+            except aiohttp.ClientError as err:
+                # Expected transport failures; skip the traceback capture
+                _LOGGER.warning("HTTP error during request to %s: %s", endpoint, err)
                 return None
-        except TimeoutError:
-            _LOGGER.error("Timeout during request to %s", endpoint)
-            return None
-        except Exception:
-            _LOGGER.exception("Error during request to %s", endpoint)
-            return None
+            # Short jittered pause before the single retry
+            await asyncio.sleep(random.uniform(0.05, 0.15))
+        return None
 
-    async def get_thermostats(self) -> list[Any]:
-        """Get list of thermostats."""
-        data = await self._make_request("GET", "/api/v1/Thermostat")
-        if isinstance(data, list):
-            return data
-        return []
+    async def get_thermostats(self) -> list[Any] | None:
+        """Get list of thermostats, or None if the request failed."""
+        thermostats = await self._make_request(
+            "GET", "/api/v1/Thermostat", expect=list
+        )
+        # An empty 200 body means the account has no thermostats
+        return None if thermostats is None else thermostats or []
 
-    async def get_groups(self) -> list[Any]:
-        """Get list of thermostat groups."""
-        data = await self._make_request("GET", "/api/v1/Group")
-        if isinstance(data, list):
-            return data
-        return []
+    async def get_groups(self) -> list[Any] | None:
+        """Get list of thermostat groups, or None if the request failed."""
+        groups = await self._make_request("GET", "/api/v1/Group", expect=list)
+        # An empty 200 body means the account has no groups
+        return None if groups is None else groups or []
 
     async def set_group_away_mode(self, group_id: str, away_mode: bool) -> bool:
         """Set away mode for a group.
@@ -116,22 +367,20 @@ class NuheatConductorAPI:
         """
         data = {"groupId": group_id, "awayMode": away_mode}
         _LOGGER.debug("Setting group away mode: %s", data)
-        result = await self._make_request("PUT", "/api/v1/Group", json=data)
+        result = await self._make_request(
+            "PUT", "/api/v1/Group", decode=False, json=data
+        )
         return result is not None
 
     async def get_account_info(self) -> dict | None:
         """Get account information including temperature scale preference."""
-        data = await self._make_request("GET", "/api/v1/Account")
-        if isinstance(data, dict):
-            return data
-        return None
+        return await self._make_request("GET", "/api/v1/Account", expect=dict)
 
     async def get_thermostat_data(self, thermostat_id: str) -> dict | None:
         """Get data for a specific thermostat."""
-        data = await self._make_request("GET", f"/api/v1/Thermostat/{thermostat_id}")
-        if isinstance(data, dict):
-            return data
-        return None
+        return await self._make_request(
+            "GET", f"/api/v1/Thermostat/{thermostat_id}", expect=dict
+        )
 
     async def set_target_temperature(
         self, thermostat_id: str, temperature: float, name: str = "", mode: int = 2
@@ -146,108 +395,227 @@ class NuheatConductorAPI:
 
         """
         # Convert temperature to integer format (30.0 = 3000)
-        temp_int = int(temperature * 100)
-        _LOGGER.debug(
-            "API set_target_temperature: temp_float=%s, temp_int=%s, mode=%s",
-            temperature,
-            temp_int,
-            mode,
-        )
+        temp_int = round(temperature * 100)
         # Include all fields from the API schema
-        data = {
-            "serialNumber": thermostat_id,
-            "name": name,
-            "setPointTemp": temp_int,
-            "scheduleMode": mode,
-            "holdSetPointDateTime": None,  # null for temporary/permanent hold
-        }
-        _LOGGER.debug("Sending to API: %s", data)
+        data = self._last_payload.get(thermostat_id)
+        if data is None:
+            data = self._last_payload[thermostat_id] = {
+                "serialNumber": thermostat_id,
+                "name": name,
+                "setPointTemp": temp_int,
+                "scheduleMode": mode,
+                "holdSetPointDateTime": None,  # null for temporary/permanent hold
+            }
+        else:
+            data["name"] = name
+            data["setPointTemp"] = temp_int
+            data["scheduleMode"] = mode
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "API set_target_temperature: temp_float=%s, sending %s",
+                temperature,
+                data,
+            )
         result = await self._make_request(
-            "PUT", "/api/v1/Thermostat", json=data
+            "PUT", "/api/v1/Thermostat", decode=False, json=data
         )
         return result is not None
 
     async def set_schedule_mode(self, thermostat_id: str, mode: int) -> bool:
         """Set the schedule mode for a thermostat."""
-        # Serial number goes in the body, not the URL path
-        data = {"serialNumber": thermostat_id, "scheduleMode": mode}
+        # Serial number goes in the body, not the URL path. The body only
+        # depends on (serial, mode), so it is encoded once and reused.
+        key = (thermostat_id, mode)
+        body = self._schedule_bodies.get(key)
+        if body is None:
+            body = self._schedule_bodies[key] = orjson.dumps(
+                {"serialNumber": thermostat_id, "scheduleMode": mode}
+            )
         result = await self._make_request(
-            "PUT", "/api/v1/Thermostat", json=data
+            "PUT",
+            "/api/v1/Thermostat",
+            decode=False,
+            data=body,
+            headers=_JSON_HEADERS,
         )
         return result is not None
 
 
+def _index_listings(
+    thermostats: list[Any], groups: list[Any]
+) -> dict[str, dict[str, dict]]:
+    """Key thermostat and group listings by their IDs."""
+    return {
+        "thermostats": {
+            t["serialNumber"]: t for t in thermostats if "serialNumber" in t
+        },
+        "groups": {g["groupId"]: g for g in groups if "groupId" in g},
+    }
+
+
+class NuheatConductorCoordinator(DataUpdateCoordinator[dict[str, dict[str, dict]]]):
+    """Coordinator polling thermostats and groups with jitter and backoff."""
+
+    def __init__(self, hass: HomeAssistant, api: NuheatConductorAPI) -> None:
+        """Initialize the coordinator."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=DOMAIN,
+            update_interval=self._jittered(SCAN_INTERVAL.total_seconds()),
+        )
+        self._api = api
+        self._failures = 0
+        self._throttled = False
+
+    @staticmethod
+    def _jittered(seconds: float) -> timedelta:
+        """Spread polls so restarts don't synchronize load on the cloud."""
+        return timedelta(seconds=seconds + random.uniform(-SCAN_JITTER, SCAN_JITTER))
+
+    async def _async_update_data(self) -> dict[str, dict[str, dict]]:
+        """Fetch all thermostats and groups with one request each."""
+        thermostats, groups = await asyncio.gather(
+            self._api.get_thermostats(), self._api.get_groups()
+        )
+        if thermostats is None:
+            if (retry_after := self._api.retry_after) and self.data is not None:
+                # Rate limited: keep entities on the last good data until
+                # the Retry-After window has passed
+                self._throttled = True
+                self.update_interval = timedelta(
+                    seconds=max(
+                        retry_after + random.uniform(0, SCAN_JITTER),
+                        SCAN_INTERVAL.total_seconds(),
+                    )
+                )
+                return self.data
+            # Back off exponentially while the API is failing
+            self._failures += 1
+            self.update_interval = self._jittered(
+                min(MAX_BACKOFF, SCAN_INTERVAL.total_seconds() * 2**self._failures)
+            )
+            raise UpdateFailed("Failed to fetch thermostats from the Nuheat API")
+
+        if self._failures or self._throttled:
+            self._failures = 0
+            self._throttled = False
+            self.update_interval = self._jittered(SCAN_INTERVAL.total_seconds())
+        data = _index_listings(thermostats, groups or [])
+        if groups is None and self.data is not None:
+            # Group fetch failed on its own; keep the last known groups
+            # rather than dropping every group entity
+            data["groups"] = self.data["groups"]
+        return data
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Nuheat Conductor climate platform from config entry."""
-    oauth_session = hass.data[DOMAIN][entry.entry_id]
-    websession = async_get_clientsession(hass)
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    oauth_session = entry_data["oauth_session"]
+    websession = entry_data["websession"]
 
     api = NuheatConductorAPI(oauth_session, websession)
 
-    try:
-        # Get account info to determine user preferences
-        account_info = await api.get_account_info()
-        temp_scale = UnitOfTemperature.FAHRENHEIT  # Default to Fahrenheit
-        use_12_hour = True  # Default to 12-hour clock
-        
-        if account_info:
-            scale = account_info.get("temperatureScale")
-            use_12_hour = account_info.get("use12Hour", True)
-            _LOGGER.debug(
-                "Account preferences - temperature scale: %s, use 12-hour: %s",
-                scale,
-                use_12_hour,
-            )
-            # API returns "Celsius" or "Fahrenheit" as strings
-            if scale == "Celsius":
-                temp_scale = UnitOfTemperature.CELSIUS
-            elif scale == "Fahrenheit":
-                temp_scale = UnitOfTemperature.FAHRENHEIT
-        
-        # Get thermostats
-        thermostats = await api.get_thermostats()
-        _LOGGER.debug("Found %d thermostats", len(thermostats))
-
-        # Get groups
-        groups = await api.get_groups()
-        _LOGGER.debug("Found %d groups", len(groups))
-
-        # Create thermostat entities
-        entities = [
-            NuheatConductorThermostat(
-                api, thermostat, entry.entry_id, temp_scale, use_12_hour
-            )
-            for thermostat in thermostats
-        ]
-        
-        # Create group entities
-        entities.extend([
-            NuheatConductorGroup(
-                api, group, entry.entry_id, temp_scale, use_12_hour
-            )
-            for group in groups
-        ])
-        
-        async_add_entities(entities, True)
-    except Exception:
-        _LOGGER.exception("Failed to get thermostats and groups")
+    # Fetch account preferences, thermostats and groups concurrently; the
+    # token refresh lock makes them share a single token validation
+    account_info, thermostats, groups = await asyncio.gather(
+        api.get_account_info(),
+        api.get_thermostats(),
+        api.get_groups(),
+        return_exceptions=True,
+    )
+    # Account info is the canary for auth/API trouble
+    if isinstance(account_info, Exception) or account_info is None:
+        raise PlatformNotReady("Unable to fetch Nuheat account information")
+    if isinstance(thermostats, Exception) or thermostats is None:
+        _LOGGER.error("Failed to get thermostats: %s", thermostats)
+        thermostats = []
+    if isinstance(groups, Exception) or groups is None:
+        _LOGGER.error("Failed to get groups: %s", groups)
+        groups = []
+
+    temp_scale = UnitOfTemperature.FAHRENHEIT  # Default to Fahrenheit
+    use_12_hour = True  # Default to 12-hour clock
+    
+    if account_info:
+        scale = account_info.get("temperatureScale")
+        use_12_hour = account_info.get("use12Hour", True)
+        _LOGGER.debug(
+            "Account preferences - temperature scale: %s, use 12-hour: %s",
+            scale,
+            use_12_hour,
+        )
+        # API returns "Celsius" or "Fahrenheit" as strings
+        if scale == "Celsius":
+            temp_scale = UnitOfTemperature.CELSIUS
+        elif scale == "Fahrenheit":
+            temp_scale = UnitOfTemperature.FAHRENHEIT
+    
+    _LOGGER.debug("Found %d thermostats", len(thermostats))
+    _LOGGER.debug("Found %d groups", len(groups))
+
+    # One coordinator feeds every entity from a single thermostat and
+    # group listing per scan interval
+    coordinator = NuheatConductorCoordinator(hass, api)
+    coordinator.async_set_updated_data(_index_listings(thermostats, groups))
+
+    # Create thermostat entities
+    entities: list[ClimateEntity] = [
+        NuheatConductorThermostat(
+            coordinator, api, thermostat, entry.entry_id, temp_scale, use_12_hour
+        )
+        for thermostat in thermostats
+    ]
+    
+    # Create group entities
+    entities.extend([
+        NuheatConductorGroup(
+            coordinator, api, group, entry.entry_id, temp_scale, use_12_hour
+        )
+        for group in groups
+    ])
+    
+    # Entities are already populated from the setup-time listing
+    async_add_entities(entities, update_before_add=False)
 
 
-class NuheatConductorThermostat(ClimateEntity):
+class NuheatConductorThermostat(
+    CoordinatorEntity[NuheatConductorCoordinator], ClimateEntity
+):
     """Representation of a Nuheat Conductor thermostat."""
 
+    # HA base classes keep a __dict__ for the _attr_* fields; slot the
+    # integration's own per-entity state for fixed-offset access
+    __slots__ = (
+        "_api",
+        "_thermostat_id",
+        "_use_12_hour",
+        "_current_temperature",
+        "_target_temperature",
+        "_schedule_mode",
+        "_is_heating",
+        "_is_online",
+        "_pending_temp",
+        "_pending_mode",
+        "_write_debouncer",
+        "_rearm_unsub",
+        "_last_state_key",
+    )
+
     _attr_has_entity_name = True
     _attr_hvac_modes = [HVACMode.HEAT, HVACMode.OFF]
-    _attr_preset_modes = ["Auto", "Hold", "Permanent Hold"]
-    # Don't set _attr_supported_features as static - use property instead
+    _attr_preset_modes = list(_PRESET_TO_MODE)
+    # _attr_supported_features is set per update rather than statically
     # so we can disable controls when offline
 
     def __init__(
         self,
+        coordinator: NuheatConductorCoordinator,
         api: NuheatConductorAPI,
         thermostat_data: dict,
         entry_id: str,
@@ -255,6 +623,7 @@ class NuheatConductorThermostat(ClimateEntity):
         use_12_hour: bool = True,
     ) -> None:
         """Initialize the thermostat."""
+        super().__init__(coordinator)
         self._api = api
         self._thermostat_id: str = thermostat_data.get("serialNumber", "")
         self._attr_name = thermostat_data.get("name", "Nuheat Conductor Thermostat")
@@ -263,12 +632,22 @@ class NuheatConductorThermostat(ClimateEntity):
         self._use_12_hour = use_12_hour  # Store for potential future use
         self._current_temperature: float | None = None
         self._target_temperature: float | None = None
-        self._min_temperature: float | None = None
-        self._max_temperature: float | None = None
         self._schedule_mode: int | None = None
         self._is_heating = False
         self._is_online = True
-        self._attr_available = True
+        # Writes queued by the service handlers and flushed as one PUT
+        self._pending_temp: float | None = None
+        self._pending_mode: int | None = None
+        # Snapshot of the fields last written to the state machine
+        self._last_state_key: tuple | None = None
+        self._rearm_unsub: CALLBACK_TYPE | None = None
+        self._write_debouncer = Debouncer(
+            coordinator.hass,
+            _LOGGER,
+            cooldown=WRITE_COOLDOWN,
+            immediate=False,
+            function=self._flush_pending_write,
+        )
 
         # Set initial values from thermostat data
         self._update_from_data(thermostat_data)
@@ -278,39 +657,65 @@ class NuheatConductorThermostat(ClimateEntity):
         if not data:
             return
         
-        _LOGGER.debug("Raw thermostat data: %s", data)
-        
-        # Convert temperatures from integer (3000 = 30.00°F) to float
-        temp = data.get("currentTemperature")
-        self._current_temperature = temp / 100.0 if temp is not None else None
-        _LOGGER.debug(
-            "Temperature conversion for %s: raw=%s, converted=%s, unit=%s",
-            self._attr_name,
-            temp,
-            self._current_temperature,
-            self._attr_temperature_unit,
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            # Raw payload; temperatures are integers in hundredths of a degree
+            _LOGGER.debug(
+                "Thermostat data for %s (%s): %s",
+                self._attr_name,
+                self._attr_temperature_unit,
+                data,
+            )
+
+        current, setpoint, min_temp, max_temp, mode, online, heating = (
+            _read_state_fields(data)
         )
-        
-        setpoint = data.get("setPointTemp")
-        self._target_temperature = setpoint / 100.0 if setpoint is not None else None
-        
-        min_temp = data.get("minTemp")
-        self._min_temperature = min_temp / 100.0 if min_temp is not None else None
-        
-        max_temp = data.get("maxTemp")
-        self._max_temperature = max_temp / 100.0 if max_temp is not None else None
-        
-        self._schedule_mode = data.get("scheduleMode")
-        self._is_online = data.get("online", True)
-        
+        # Convert temperatures from integer (3000 = 30.00°F) to float
+        self._current_temperature = _to_degrees(current)
+        self._target_temperature = _to_degrees(setpoint)
+        # Fall back to unit-based defaults when the API omits the limits
+        default_min, default_max = _DEFAULT_TEMP_LIMITS[self._attr_temperature_unit]
+        min_temp = _to_degrees(min_temp)
+        self._attr_min_temp = min_temp if min_temp is not None else default_min
+        max_temp = _to_degrees(max_temp)
+        self._attr_max_temp = max_temp if max_temp is not None else default_max
+        self._schedule_mode = mode
+        self._is_online = online
+
         # If offline, override heating status to prevent showing active heating
         if not self._is_online:
             self._is_heating = False
         else:
-            self._is_heating = data.get("isHeating", False)
+            self._is_heating = heating
         
         # Keep entity available even when offline so data still displays
         # We'll indicate offline status through hvac_action and attributes
+        if not self._is_online:
+            # Show as OFF when offline so UI clearly indicates no active control
+            self._attr_hvac_mode, self._attr_hvac_action = HVACMode.OFF, HVACAction.OFF
+            self._attr_supported_features = _OFFLINE_FEATURES
+            self._attr_extra_state_attributes = {
+                "connection_status": "Offline",
+                "warning": "Thermostat is offline - showing last known settings",
+            }
+        else:
+            self._attr_hvac_mode = HVACMode.HEAT
+            self._attr_hvac_action = (
+                HVACAction.HEATING if self._is_heating else HVACAction.IDLE
+            )
+            self._attr_supported_features = _ONLINE_FEATURES
+            self._attr_extra_state_attributes = {"connection_status": "Online"}
+
+    @property
+    def available(self) -> bool:
+        """Return True while the thermostat is in the account listing.
+
+        Offline thermostats stay available so their last known settings
+        still display; offline status shows through hvac_action instead.
+        """
+        return (
+            super().available
+            and self._thermostat_id in self.coordinator.data["thermostats"]
+        )
 
     @property
     def current_temperature(self) -> float | None:
@@ -322,74 +727,13 @@ class NuheatConductorThermostat(ClimateEntity):
         """Return the temperature we try to reach."""
         return self._target_temperature
 
-    @property
-    def min_temp(self) -> float:
-        """Return the minimum temperature."""
-        if self._min_temperature is not None:
-            return self._min_temperature
-        # Default based on temperature unit
-        return 5.0 if self._attr_temperature_unit == UnitOfTemperature.CELSIUS else 41.0
-
-    @property
-    def max_temp(self) -> float:
-        """Return the maximum temperature."""
-        if self._max_temperature is not None:
-            return self._max_temperature
-        # Default based on temperature unit  
-        return 40.0 if self._attr_temperature_unit == UnitOfTemperature.CELSIUS else 104.0
-
-    @property
-    def hvac_mode(self) -> HVACMode:
-        """Return current HVAC mode."""
-        # Show as OFF when offline so UI clearly indicates no active control
-        if not self._is_online:
-            return HVACMode.OFF
-        return HVACMode.HEAT
-
     @property
     def preset_mode(self) -> str | None:
         """Return the current preset mode."""
-        if self._schedule_mode == 1:
-            return "Auto"
-        elif self._schedule_mode == 2:
-            return "Hold"
-        elif self._schedule_mode == 3:
-            return "Permanent Hold"
-        return None
-
-    @property
-    def supported_features(self) -> ClimateEntityFeature:
-        """Return the list of supported features."""
-        # Disable all controls when thermostat is offline
-        if not self._is_online:
-            return ClimateEntityFeature(0)  # No features when offline
-        return (
-            ClimateEntityFeature.TARGET_TEMPERATURE | ClimateEntityFeature.PRESET_MODE
-        )
-
-    @property
-    def hvac_action(self) -> HVACAction:
-        """Return current HVAC action."""
-        # Show OFF when offline (entity stays available to show settings)
-        if not self._is_online:
-            return HVACAction.OFF
-        if self._is_heating:
-            return HVACAction.HEATING
-        return HVACAction.IDLE
-
-    @property
-    def extra_state_attributes(self) -> Mapping[str, Any] | None:
-        """Return additional state attributes."""
-        attrs: dict[str, Any] = {}
-        
-        # Show prominent online/offline status
-        attrs["connection_status"] = "Online" if self._is_online else "Offline"
-        
-        # Add warning badge for offline thermostats
-        if not self._is_online:
-            attrs["warning"] = "Thermostat is offline - showing last known settings"
-        
-        return attrs
+        mode = self._schedule_mode
+        if mode is None or not 0 <= mode < len(_MODE_TO_PRESET):
+            return None
+        return _MODE_TO_PRESET[mode]
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature."""
@@ -412,24 +756,7 @@ class NuheatConductorThermostat(ClimateEntity):
             self._attr_temperature_unit,
         )
 
-        success = await self._api.set_target_temperature(
-            self._thermostat_id, temperature, name=self._attr_name, mode=2
-        )
-        if success:
-            # Don't update _target_temperature here - let the next API refresh handle it
-            # to avoid any unit conversion confusion
-            self._schedule_mode = 2  # Temporary hold
-            _LOGGER.debug("Temperature set command sent successfully")
-            self.async_write_ha_state()
-        else:
-            # Failed to set temperature (likely thermostat is offline)
-            # Refresh state from API to revert UI to actual values
-            _LOGGER.warning(
-                "Failed to set temperature for %s, reverting to actual state",
-                self._attr_name,
-            )
-            await self.async_update()
-            self.async_write_ha_state()
+        await self._async_queue_write(2, temperature)  # Temporary hold
 
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Set preset mode."""
@@ -445,28 +772,72 @@ class NuheatConductorThermostat(ClimateEntity):
             return
 
         # Map preset mode to schedule mode
-        mode_map = {
-            "Auto": 1,  # Schedule
-            "Hold": 2,  # Temporary hold
-            "Permanent Hold": 3,  # Permanent hold
-        }
-        
-        mode = mode_map.get(preset_mode)
+        mode = _PRESET_TO_MODE.get(preset_mode)
         if mode is None:
             _LOGGER.error("Unknown preset mode: %s", preset_mode)
             return
 
-        success = await self._api.set_schedule_mode(self._thermostat_id, mode)
+        await self._async_queue_write(mode)
+
+    async def _async_queue_write(
+        self, mode: int, temperature: float | None = None
+    ) -> None:
+        """Show a write optimistically and queue it for the next flush."""
+        if temperature is not None:
+            self._pending_temp = self._target_temperature = temperature
+        self._pending_mode = self._schedule_mode = mode
+        self.async_write_ha_state()
+        await self._write_debouncer.async_call()
+
+    async def _flush_pending_write(self) -> None:
+        """Send the queued setpoint and/or schedule mode as a single PUT."""
+        temperature, mode = self._pending_temp, self._pending_mode
+        self._pending_temp = self._pending_mode = None
+        if mode is None:
+            return
+
+        if temperature is not None:
+            success = await self._api.set_target_temperature(
+                self._thermostat_id, temperature, name=self._attr_name, mode=mode
+            )
+        else:
+            success = await self._api.set_schedule_mode(self._thermostat_id, mode)
+
         if success:
-            self._schedule_mode = mode
-            self.async_write_ha_state()
+            # State was already written optimistically; a debounced refresh
+            # brings it in line with what the thermostat reports. It runs as
+            # its own task so the write debouncer's lock isn't held across
+            # the GETs.
+            self._last_state_key = None
+            _LOGGER.debug("Write for %s sent successfully", self._attr_name)
+            self.hass.async_create_task(self.coordinator.async_request_refresh())
         else:
+            # Failed to write (likely thermostat is offline)
+            # Roll the optimistic state back to the last coordinator
+            # snapshot, then ask for a debounced refresh so concurrent
+            # failures share one GET
             _LOGGER.warning(
-                "Failed to set preset mode for %s, reverting to actual state",
+                "Failed to update %s, reverting to actual state",
                 self._attr_name,
             )
-            await self.async_update()
-            self.async_write_ha_state()
+            self._last_state_key = None  # Force the revert to be written
+            self._handle_coordinator_update()
+            self.hass.async_create_task(self.coordinator.async_request_refresh())
+
+        if self._pending_mode is not None and self._rearm_unsub is None:
+            # The debouncer drops calls made while this job holds its lock,
+            # so a write queued during the PUT has to be re-armed once the
+            # job has returned
+            self._rearm_unsub = async_call_later(
+                self.hass, WRITE_COOLDOWN, self._async_rearm_write
+            )
+
+    @callback
+    def _async_rearm_write(self, _now: Any) -> None:
+        """Schedule a flush for a write queued during the previous one."""
+        self._rearm_unsub = None
+        if self._pending_mode is not None:
+            self.hass.async_create_task(self._write_debouncer.async_call())
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set HVAC mode."""
@@ -481,31 +852,60 @@ class NuheatConductorThermostat(ClimateEntity):
             )
             return
 
+        # No off/vacation schedule mode exists, so OFF is a hold at the
+        # minimum setpoint and HEAT re-holds the current target. Queue the
+        # write directly; the checks above already cover async_set_temperature's.
         if hvac_mode == HVACMode.HEAT:
-            if self._target_temperature:
-                await self.async_set_temperature(temperature=self._target_temperature)
+            if not self._target_temperature:
+                return
+            await self._async_queue_write(2, self._target_temperature)
         elif hvac_mode == HVACMode.OFF:
-            await self.async_set_temperature(temperature=self.min_temp)
-
-    async def async_update(self) -> None:
-        """Update thermostat data."""
-        if not self._thermostat_id:
-            return
-
-        data = await self._api.get_thermostat_data(self._thermostat_id)
+            await self._async_queue_write(2, self.min_temp)
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Drop any queued write when the entity is removed."""
+        self._write_debouncer.async_cancel()
+        if self._rearm_unsub is not None:
+            self._rearm_unsub()
+            self._rearm_unsub = None
+        await super().async_will_remove_from_hass()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Update state from the shared coordinator data."""
+        data = self.coordinator.data["thermostats"].get(self._thermostat_id)
         if data:
+            # Skip the state write on the common "nothing changed" tick;
+            # last_update_success is part of the key since it drives
+            # availability
+            key = (
+                *_read_state_fields(data),
+                self.coordinator.last_update_success,
+            )
+            if key == self._last_state_key:
+                return
+            self._last_state_key = key
             self._update_from_data(data)
-            # Keep entity available even if thermostat is offline
-            # This allows users to see last known settings
-            self._attr_available = True
         else:
-            # Only mark unavailable if we can't reach the API at all
-            self._attr_available = False
+            # Thermostat missing from the account listing; see available
+            self._last_state_key = None
+        super()._handle_coordinator_update()
 
 
-class NuheatConductorGroup(ClimateEntity):
+class NuheatConductorGroup(
+    CoordinatorEntity[NuheatConductorCoordinator], ClimateEntity
+):
     """Representation of a Nuheat Conductor thermostat group."""
 
+    # See NuheatConductorThermostat: only the integration's own state is slotted
+    __slots__ = (
+        "_api",
+        "_group_id",
+        "_use_12_hour",
+        "_away_mode",
+        "_away_setpoint",
+    )
+
     _attr_has_entity_name = True
     _attr_hvac_modes = [HVACMode.HEAT]
     _attr_preset_modes = ["Home", "Away"]
@@ -513,6 +913,7 @@ class NuheatConductorGroup(ClimateEntity):
 
     def __init__(
         self,
+        coordinator: NuheatConductorCoordinator,
         api: NuheatConductorAPI,
         group_data: dict,
         entry_id: str,
@@ -520,6 +921,7 @@ class NuheatConductorGroup(ClimateEntity):
         use_12_hour: bool = True,
     ) -> None:
         """Initialize the group."""
+        super().__init__(coordinator)
         self._api = api
         self._group_id: str = group_data.get("groupId", "")
         group_name = group_data.get("groupName", "Nuheat Group")
@@ -529,7 +931,6 @@ class NuheatConductorGroup(ClimateEntity):
         self._use_12_hour = use_12_hour
         self._away_mode: bool = False
         self._away_setpoint: float | None = None
-        self._attr_available = True
 
         # Set initial values from group data
         self._update_from_data(group_data)
@@ -540,10 +941,10 @@ class NuheatConductorGroup(ClimateEntity):
             return
 
         self._away_mode = data.get("awayMode", False)
+        self._attr_preset_mode = "Away" if self._away_mode else "Home"
         
         # Convert away setpoint temperature
-        away_temp = data.get("awaySetPointTemp")
-        self._away_setpoint = away_temp / 100.0 if away_temp is not None else None
+        self._away_setpoint = _to_degrees(data.get("awaySetPointTemp"))
 
     @property
     def hvac_mode(self) -> HVACMode:
@@ -551,11 +952,11 @@ class NuheatConductorGroup(ClimateEntity):
         return HVACMode.HEAT
 
     @property
-    def preset_mode(self) -> str | None:
-        """Return the current preset mode."""
-        if self._away_mode:
-            return "Away"
-        return "Home"
+    def available(self) -> bool:
+        """Return True while the group is in the account listing."""
+        return (
+            super().available and self._group_id in self.coordinator.data["groups"]
+        )
 
     @property
     def current_temperature(self) -> float | None:
@@ -587,6 +988,7 @@ class NuheatConductorGroup(ClimateEntity):
         success = await self._api.set_group_away_mode(self._group_id, away_mode)
         if success:
             self._away_mode = away_mode
+            self._attr_preset_mode = "Away" if away_mode else "Home"
             _LOGGER.debug("Group %s preset set to %s", self._attr_name, preset_mode)
             self.async_write_ha_state()
         else:
@@ -594,25 +996,18 @@ class NuheatConductorGroup(ClimateEntity):
                 "Failed to set preset mode for %s, reverting to actual state",
                 self._attr_name,
             )
-            await self.async_update()
-            self.async_write_ha_state()
+            self._handle_coordinator_update()
+            await self.coordinator.async_request_refresh()
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Groups don't support HVAC mode changes."""
         pass
 
-    async def async_update(self) -> None:
-        """Update group data."""
-        if not self._group_id:
-            return
-
-        # Fetch all groups and find ours
-        groups = await self._api.get_groups()
-        for group in groups:
-            if group.get("groupId") == self._group_id:
-                self._update_from_data(group)
-                self._attr_available = True
-                return
-        
-        # Group not found
-        self._attr_available = False
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Update state from the shared coordinator data."""
+        data = self.coordinator.data["groups"].get(self._group_id)
+        if data:
+            self._update_from_data(data)
+        # A group missing from the listing goes unavailable; see available
+        super()._handle_coordinator_update()